@@ -125,6 +125,11 @@ void pybind_core_tensor(py::module& m) {
                            core::Device::DeviceType::CUDA, device_id));
                })
             .def("cpu", [](const core::Tensor& tensor) {
+                // Tensors already in CPU are returned without a copy.
+                if (tensor.GetDevice().GetType() ==
+                    core::Device::DeviceType::CPU) {
+                    return tensor;
+                }
                 return tensor.Copy(
                         core::Device(core::Device::DeviceType::CPU, 0));
             });
@@ -70,10 +70,10 @@ if __name__ == "__main__":
     ]:
         constraint_ids = np.array(constraint_ids, dtype=np.int32)
         constraint_pos = o3d.utility.Vector3dVector(constraint_pos)
-        tic = time.time()
+        tic = time.perf_counter()
         mesh_prime = mesh.deform_as_rigid_as_possible(
             o3d.utility.IntVector(constraint_ids), constraint_pos, max_iter=50)
-        print("deform took {}[s]".format(time.time() - tic))
+        print("deform took {}[s]".format(time.perf_counter() - tic))
         mesh_prime.compute_vertex_normals()
 
         mesh.paint_uniform_color((1, 0, 0))
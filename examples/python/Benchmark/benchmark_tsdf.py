@@ -27,7 +27,7 @@ def run_benchmark():
         color_type=o3d.pipelines.integration.TSDFVolumeColorType.RGB8,
     )
 
-    s = time.time()
+    s = time.perf_counter()
     for i in range(len(camera_poses)):
         color = o3d.io.read_image(
             os.path.join(dataset_path, "color", "{0:05d}.jpg".format(i)))
@@ -40,15 +40,15 @@ def run_benchmark():
             camera_intrinsics,
             np.linalg.inv(camera_poses[i].pose),
         )
-    time_integrate = time.time() - s
+    time_integrate = time.perf_counter() - s
 
-    s = time.time()
+    s = time.perf_counter()
     mesh = volume.extract_triangle_mesh()
-    time_extract_mesh = time.time() - s
+    time_extract_mesh = time.perf_counter() - s
 
-    s = time.time()
+    s = time.perf_counter()
     pcd = volume.extract_point_cloud()
-    time_extract_pcd = time.time() - s
+    time_extract_pcd = time.perf_counter() - s
 
     return time_integrate, time_extract_mesh, time_extract_pcd
 
@@ -209,7 +209,7 @@ def print_1D_array_for_cpp(prefix, array):
         dtype = "int"
     elif array.dtype == np.uint32:
         dtype = "size_t"
-    elif array.dtype == np.bool:
+    elif array.dtype == bool:
         dtype = "bool"
     else:
         raise Exception("invalid dtype")
@@ -63,25 +63,25 @@ if __name__ == "__main__":
 
     times = [0, 0, 0, 0]
     if args.make:
-        start_time = time.time()
+        start_time = time.perf_counter()
         import make_fragments
         make_fragments.run(config)
-        times[0] = time.time() - start_time
+        times[0] = time.perf_counter() - start_time
     if args.register:
-        start_time = time.time()
+        start_time = time.perf_counter()
         import register_fragments
         register_fragments.run(config)
-        times[1] = time.time() - start_time
+        times[1] = time.perf_counter() - start_time
     if args.refine:
-        start_time = time.time()
+        start_time = time.perf_counter()
         import refine_registration
         refine_registration.run(config)
-        times[2] = time.time() - start_time
+        times[2] = time.perf_counter() - start_time
     if args.integrate:
-        start_time = time.time()
+        start_time = time.perf_counter()
         import integrate_scene
         integrate_scene.run(config)
-        times[3] = time.time() - start_time
+        times[3] = time.perf_counter() - start_time
 
     print("====================================")
     print("Elapsed time (in h:m:s)")
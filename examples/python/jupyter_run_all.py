@@ -1,17 +1,138 @@
 import nbformat
 import nbconvert
+from jupyter_client.manager import start_new_kernel
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing.util
+import functools
+import hashlib
+import sys
 import os
 import argparse
 
+
+def open3d_version():
+    # Read from the package metadata, such that Open3D is not loaded into the
+    # driver and its worker processes only for its version. There is no such
+    # metadata if Open3D is used from its build directory or is packaged under
+    # another PYPI_PACKAGE_NAME, then the version is read from Open3D itself.
+    try:
+        from importlib.metadata import version, PackageNotFoundError
+    except ImportError:  # Python < 3.8
+        from pkg_resources import get_distribution
+        from pkg_resources import DistributionNotFound as PackageNotFoundError
+
+        def version(name):
+            return get_distribution(name).version
+
+    try:
+        return version("open3d")
+    except PackageNotFoundError:
+        import open3d
+        return open3d.__version__
+
+
+def notebook_hash(nb_path):
+    # A notebook needs to be executed again if its content, the Python
+    # interpreter or the Open3D version changes.
+    h = hashlib.blake2b(nb_path.read_bytes())
+    h.update(sys.version.encode("utf-8"))
+    h.update(open3d_version().encode("utf-8"))
+    return h.hexdigest()
+
+
+def notebook_hash_path(nb_path):
+    return nb_path.with_suffix(".nbhash")
+
+
+def is_up_to_date(nb_path):
+    hash_path = notebook_hash_path(nb_path)
+    return hash_path.exists() and hash_path.read_text(
+        encoding="utf-8") == notebook_hash(nb_path)
+
+
+# The kernel manager and client of the kernel shared by all notebooks executed
+# by this process.
+_kernel = None
+
+
+def get_kernel():
+    # Started with the first notebook of the process. This is equivalent to
+    # ProcessPoolExecutor(initializer=...), which needs Python 3.7.
+    global _kernel
+    if _kernel is None:
+        _kernel = start_new_kernel()
+        # Worker processes don't run atexit handlers, multiprocessing's
+        # finalizers are run on exit by the main and the worker processes
+        # alike.
+        multiprocessing.util.Finalize(None, stop_kernel, exitpriority=10)
+    return _kernel
+
+
+def stop_kernel():
+    km, kc = _kernel
+    kc.stop_channels()
+    km.shutdown_kernel(now=True)
+
+
+def reset_kernel(kc, cwd):
+    # Moves to the directory of the next notebook and clears the variables left
+    # over by the previous one. A new session also restarts the execution count
+    # at 1, such that the prompt numbers of written notebooks don't depend on
+    # the notebooks executed before. Already imported modules (e.g. open3d) stay
+    # loaded, which is what saves the start-up time.
+    code = ("import os\nos.chdir({!r})\n"
+            "get_ipython().reset(new_session=True)".format(str(cwd)))
+    kc.execute_interactive(code, silent=True)
+
+
+def run_notebook(nb_path, write=False, break_on_failure=False):
+    print("[Executing notebook {}]".format(nb_path.name))
+    km, kc = get_kernel()
+    reset_kernel(kc, nb_path.parent)
+
+    with open(nb_path) as f:
+        nb = nbformat.read(f, as_version=4)
+    ep = nbconvert.preprocessors.ExecutePreprocessor(timeout=6000)
+    try:
+        ep.preprocess(nb, {"metadata": {"path": nb_path.parent}}, km=km)
+    except nbconvert.preprocessors.execute.CellExecutionError as e:
+        print("Execution of {} failed".format(nb_path.name))
+        if break_on_failure:
+            raise
+        return
+
+    if write:
+        print("Writing the executed notebook {}".format(nb_path.name))
+        with open(nb_path, "w", encoding="utf-8") as f:
+            nbformat.write(nb, f)
+
+    # Only successfully executed notebooks are recorded, such that failed
+    # ones are retried on the next run.
+    notebook_hash_path(nb_path).write_text(notebook_hash(nb_path),
+                                           encoding="utf-8")
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
     parser.add_argument("--write", action='store_true')
     parser.add_argument("--break_on_failure", action='store_true')
+    parser.add_argument("--force",
+                        action='store_true',
+                        help="Execute notebooks even if they are unchanged "
+                        "since their last successful execution. Implied by "
+                        "--write.")
+    parser.add_argument("--num_workers",
+                        type=int,
+                        default=os.cpu_count(),
+                        help="Number of notebooks executed in parallel. "
+                        "Notebooks are executed sequentially with "
+                        "--break_on_failure.")
     args = parser.parse_args()
 
     # Setting os.environ["CI"] will disable interactive (blocking) mode in
-    # Jupyter notebooks
+    # Jupyter notebooks. This must be set before the worker processes are
+    # created, such that they inherit it.
     os.environ["CI"] = "true"
 
     file_dir = Path(__file__).absolute().parent
@@ -22,20 +143,30 @@ if __name__ == "__main__":
     for nb_path in nb_paths:
         print("> {}".format(nb_path))
 
-    for nb_path in nb_paths:
-        print("[Executing notebook {}]".format(nb_path.name))
-
-        with open(nb_path) as f:
-            nb = nbformat.read(f, as_version=4)
-        ep = nbconvert.preprocessors.ExecutePreprocessor(timeout=6000)
-        try:
-            ep.preprocess(nb, {"metadata": {"path": nb_path.parent}})
-        except nbconvert.preprocessors.execute.CellExecutionError as e:
-            print("Execution of {} failed".format(nb_path.name))
-            if args.break_on_failure:
-                raise
-
-        if args.write:
-            print("Writing the executed notebook")
-            with open(nb_path, "w", encoding="utf-8") as f:
-                nbformat.write(nb, f)
+    # A successful run without --write leaves the notebooks unchanged on disk,
+    # so --write must not skip them, otherwise their outputs are never saved.
+    if not (args.force or args.write):
+        unchanged_nb_paths = [p for p in nb_paths if is_up_to_date(p)]
+        for nb_path in unchanged_nb_paths:
+            print("[Skipping unchanged notebook {}]".format(nb_path.name))
+        nb_paths = [p for p in nb_paths if p not in unchanged_nb_paths]
+    if not nb_paths:
+        sys.exit(0)
+
+    run = functools.partial(run_notebook,
+                            write=args.write,
+                            break_on_failure=args.break_on_failure)
+
+    if args.break_on_failure:
+        # Executed sequentially, such that the first failure stops the run.
+        for nb_path in nb_paths:
+            run(nb_path)
+    else:
+        # Each worker starts one kernel and the notebooks are handed to the
+        # workers one at a time, such that a worker that is done with a short
+        # notebook picks up the next one. The datasets shared by the notebooks
+        # are downloaded atomically by open3d_tutorial.py, so the workers may
+        # fetch them concurrently.
+        num_workers = max(1, min(args.num_workers, len(nb_paths)))
+        with ProcessPoolExecutor(max_workers=num_workers) as executor:
+            list(executor.map(run, nb_paths))
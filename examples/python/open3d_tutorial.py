@@ -10,6 +10,7 @@ import tarfile
 import gzip
 import zipfile
 import shutil
+import tempfile
 
 interactive = True
 
@@ -83,17 +84,39 @@ def _relative_path(path):
     return os.path.join(script_dir, path)
 
 
+def _download_atomically(path, fetch):
+    """
+    Creates `path` unless it exists. fetch(tmp_dir) downloads the data into the
+    private directory tmp_dir and returns the path of the result in it, which
+    is then moved to `path` in one step. Concurrent callers, e.g. notebooks
+    executed in parallel, thus never see partially written data.
+    """
+    if os.path.exists(path):
+        return
+    with tempfile.TemporaryDirectory(dir=os.path.dirname(path)) as tmp_dir:
+        tmp_path = fetch(tmp_dir)
+        try:
+            os.replace(tmp_path, path)
+        except OSError:
+            # Another process has put the same directory in place first.
+            if not os.path.exists(path):
+                raise
+
+
 def download_fountain_dataset():
     fountain_path = _relative_path("../test_data/fountain_small")
-    fountain_zip_path = _relative_path("../test_data/fountain.zip")
-    if not os.path.exists(fountain_path):
+
+    def fetch(tmp_dir):
         print("downloading fountain dataset")
         url = "https://storage.googleapis.com/isl-datasets/open3d-dev/fountain.zip"
+        fountain_zip_path = os.path.join(tmp_dir, "fountain.zip")
         urllib.request.urlretrieve(url, fountain_zip_path)
         print("extract fountain dataset")
         with zipfile.ZipFile(fountain_zip_path, "r") as zip_ref:
-            zip_ref.extractall(os.path.dirname(fountain_path))
-        os.remove(fountain_zip_path)
+            zip_ref.extractall(tmp_dir)
+        return os.path.join(tmp_dir, "fountain_small")
+
+    _download_atomically(fountain_path, fetch)
     return fountain_path
 
 
@@ -176,15 +199,20 @@ def get_intersecting_boxes_mesh():
 
 def get_armadillo_mesh():
     armadillo_path = _relative_path("../test_data/Armadillo.ply")
-    if not os.path.exists(armadillo_path):
+
+    def fetch(tmp_dir):
         print("downloading armadillo mesh")
         url = "http://graphics.stanford.edu/pub/3Dscanrep/armadillo/Armadillo.ply.gz"
-        urllib.request.urlretrieve(url, armadillo_path + ".gz")
+        gz_path = os.path.join(tmp_dir, "Armadillo.ply.gz")
+        urllib.request.urlretrieve(url, gz_path)
         print("extract armadillo mesh")
-        with gzip.open(armadillo_path + ".gz", "rb") as fin:
-            with open(armadillo_path, "wb") as fout:
+        ply_path = os.path.join(tmp_dir, "Armadillo.ply")
+        with gzip.open(gz_path, "rb") as fin:
+            with open(ply_path, "wb") as fout:
                 shutil.copyfileobj(fin, fout)
-        os.remove(armadillo_path + ".gz")
+        return ply_path
+
+    _download_atomically(armadillo_path, fetch)
     mesh = o3d.io.read_triangle_mesh(armadillo_path)
     mesh.compute_vertex_normals()
     return mesh
@@ -192,24 +220,19 @@ def get_armadillo_mesh():
 
 def get_bunny_mesh():
     bunny_path = _relative_path("../test_data/Bunny.ply")
-    if not os.path.exists(bunny_path):
+
+    def fetch(tmp_dir):
         print("downloading bunny mesh")
         url = "http://graphics.stanford.edu/pub/3Dscanrep/bunny.tar.gz"
-        urllib.request.urlretrieve(url, bunny_path + ".tar.gz")
+        tar_path = os.path.join(tmp_dir, "bunny.tar.gz")
+        urllib.request.urlretrieve(url, tar_path)
         print("extract bunny mesh")
-        with tarfile.open(bunny_path + ".tar.gz") as tar:
-            tar.extractall(path=os.path.dirname(bunny_path))
-        shutil.move(
-            os.path.join(
-                os.path.dirname(bunny_path),
-                "bunny",
-                "reconstruction",
-                "bun_zipper.ply",
-            ),
-            bunny_path,
-        )
-        os.remove(bunny_path + ".tar.gz")
-        shutil.rmtree(os.path.join(os.path.dirname(bunny_path), "bunny"))
+        with tarfile.open(tar_path) as tar:
+            tar.extractall(path=tmp_dir)
+        return os.path.join(tmp_dir, "bunny", "reconstruction",
+                            "bun_zipper.ply")
+
+    _download_atomically(bunny_path, fetch)
     mesh = o3d.io.read_triangle_mesh(bunny_path)
     mesh.compute_vertex_normals()
     return mesh
@@ -223,9 +246,14 @@ def get_knot_mesh():
 
 def get_eagle_pcd():
     path = _relative_path("../test_data/eagle.ply")
-    if not os.path.exists(path):
+
+    def fetch(tmp_dir):
         print("downloading eagle pcl")
         url = "http://www.cs.jhu.edu/~misha/Code/PoissonRecon/eagle.points.ply"
-        urllib.request.urlretrieve(url, path)
+        tmp_path = os.path.join(tmp_dir, "eagle.ply")
+        urllib.request.urlretrieve(url, tmp_path)
+        return tmp_path
+
+    _download_atomically(path, fetch)
     pcd = o3d.io.read_point_cloud(path)
     return pcd
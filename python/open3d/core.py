@@ -22,7 +22,7 @@ def _numpy_dtype_to_dtype(numpy_dtype):
         return Dtype.Int64
     elif numpy_dtype == np.uint8:
         return Dtype.UInt8
-    elif numpy_dtype == np.bool:
+    elif numpy_dtype == bool:
         return Dtype.Bool
     else:
         raise ValueError("Unsupported numpy dtype:", numpy_dtype)
@@ -0,0 +1,80 @@
+# ----------------------------------------------------------------------------
+# -                        Open3D: www.open3d.org                            -
+# ----------------------------------------------------------------------------
+# The MIT License (MIT)
+#
+# Copyright (c) 2020 www.open3d.org
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+# ----------------------------------------------------------------------------
+
+import time
+import pytest
+
+
+def pytest_addoption(parser):
+    parser.addoption("--bench",
+                     action="store_true",
+                     default=False,
+                     help="Time the ops run through the bench fixture.")
+    parser.addoption("--bench_iterations",
+                     type=int,
+                     default=1000,
+                     help="Number of timed iterations of each op with --bench.")
+
+
+def pytest_configure(config):
+    config._bench_results = []
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    if not config._bench_results:
+        return
+    terminalreporter.section("bench")
+    for nodeid, ns_per_op in config._bench_results:
+        terminalreporter.write_line("{:>12.1f} ns/op  {}".format(
+            ns_per_op, nodeid))
+
+
+@pytest.fixture
+def bench(request):
+    """
+    Returns a function run(fn) that calls fn() and returns its result. With
+    --bench, fn() is additionally called --bench_iterations times and the
+    average wall time per call is reported at the end of the session. fn()
+    must return a Tensor. The last result is copied to CPU, such that device
+    work still in flight is included in the timing.
+    """
+    config = request.config
+
+    def run(fn):
+        result = fn()
+        if not config.getoption("--bench"):
+            return result
+        num_iters = max(1, config.getoption("--bench_iterations"))
+        start = time.perf_counter()
+        for _ in range(num_iters):
+            last = fn()
+        last.cpu()
+        elapsed = time.perf_counter() - start
+        config._bench_results.append(
+            (request.node.nodeid, elapsed / num_iters * 1e9))
+        return result
+
+    return run
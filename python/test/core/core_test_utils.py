@@ -27,6 +27,7 @@
 import open3d as o3d
 import numpy as np
 import pytest
+import functools
 
 import open3d as o3d
 import numpy as np
@@ -42,14 +43,18 @@ def torch_available():
     return True
 
 
+@functools.lru_cache(maxsize=1)
 def list_devices():
     """
     If Open3D is built with CUDA support:
-    - If cuda device is available, returns [Device("CPU:0"), Device("CUDA:0")].
-    - If cuda device is not available, returns [Device("CPU:0")].
+    - If cuda device is available, returns (Device("CPU:0"), Device("CUDA:0")).
+    - If cuda device is not available, returns (Device("CPU:0"),).
 
     If Open3D is built without CUDA support:
-    - returns [Device("CPU:0")].
+    - returns (Device("CPU:0"),).
+
+    The result is computed once and cached, as querying the CUDA devices is
+    expensive and this is called for every parametrized test.
     """
     devices = [o3d.core.Device("CPU:" + str(0))]
     if torch_available() and o3d._build_config['BUILD_CUDA_MODULE']:
@@ -62,4 +67,4 @@ def list_devices():
                                   torch.cuda.device_count()))
     if o3d.core.cuda.device_count() > 0:
         devices.append(o3d.core.Device("CUDA:0"))
-    return devices
+    return tuple(devices)
@@ -26,6 +26,7 @@
 
 import open3d as o3d
 import numpy as np
+import operator
 import pytest
 import core_test_utils
 
@@ -33,6 +34,10 @@ if core_test_utils.torch_available():
     import torch
     import torch.utils.dlpack
 
+# Tolerances of the floating-point elementwise checks.
+_RTOL = 1e-5
+_ATOL = 0
+
 
 @pytest.mark.parametrize("device", core_test_utils.list_devices())
 def test_creation(device):
@@ -60,15 +65,21 @@ def test_creation(device):
     np.testing.assert_equal(t.cpu().numpy(), np.full((2,), 3.5, dtype=np.uint8))
 
 
-@pytest.mark.parametrize("shape", [(), (0,), (1,), (0, 2), (0, 0, 2),
-                                   (2, 0, 3)])
+_SPECIAL_SHAPES = [(), (0,), (1,), (0, 2), (0, 0, 2), (2, 0, 3)]
+# NumPy references of test_creation_special_shapes, shared by all devices.
+_NP_FULLS = {
+    shape: np.full(shape, 3.14, dtype=np.float32) for shape in _SPECIAL_SHAPES
+}
+
+
+@pytest.mark.parametrize("shape", _SPECIAL_SHAPES)
 @pytest.mark.parametrize("device", core_test_utils.list_devices())
 def test_creation_special_shapes(shape, device):
     o3_t = o3d.core.Tensor.full(shape,
                                 3.14,
                                 o3d.core.Dtype.Float32,
                                 device=device)
-    np_t = np.full(shape, 3.14, dtype=np.float32)
+    np_t = _NP_FULLS[shape]
     np.testing.assert_equal(o3_t.cpu().numpy(), np_t)
 
 
@@ -148,12 +159,12 @@ def test_tensor_constructor(device):
     # Numpy array
     np_t = np.array([[0, 1, 2], [3, 4, 5]])
     o3_t = o3d.core.Tensor(np_t, dtype, device)
-    np.testing.assert_equal(np_t, o3_t.cpu().numpy())
+    np.testing.assert_array_equal(np_t, o3_t.cpu().numpy())
 
     # 2D list
     li_t = [[0, 1, 2], [3, 4, 5]]
     no3_t = o3d.core.Tensor(li_t, dtype, device)
-    np.testing.assert_equal(li_t, o3_t.cpu().numpy())
+    np.testing.assert_array_equal(li_t, o3_t.cpu().numpy())
 
     # 2D list, inconsistent length
     li_t = [[0, 1, 2], [3, 4]]
@@ -164,19 +175,19 @@ def test_tensor_constructor(device):
     np_t_double = np.array([[0., 1.5, 2.], [3., 4., 5.]])
     np_t_int = np.array([[0, 1, 2], [3, 4, 5]])
     o3_t = o3d.core.Tensor(np_t_double, dtype, device)
-    np.testing.assert_equal(np_t_int, o3_t.cpu().numpy())
+    np.testing.assert_array_equal(np_t_int, o3_t.cpu().numpy())
 
     # Special strides
     np_t = np.random.randint(10, size=(10, 10))[1:10:2, 1:10:3].T
     o3_t = o3d.core.Tensor(np_t, dtype, device)
-    np.testing.assert_equal(np_t, o3_t.cpu().numpy())
+    np.testing.assert_array_equal(np_t, o3_t.cpu().numpy())
 
     # Boolean
-    np_t = np.array([True, False, True], dtype=np.bool)
+    np_t = np.array([True, False, True], dtype=bool)
     o3_t = o3d.core.Tensor([True, False, True], o3d.core.Dtype.Bool, device)
-    np.testing.assert_equal(np_t, o3_t.cpu().numpy())
+    np.testing.assert_array_equal(np_t, o3_t.cpu().numpy())
     o3_t = o3d.core.Tensor(np_t, o3d.core.Dtype.Bool, device)
-    np.testing.assert_equal(np_t, o3_t.cpu().numpy())
+    np.testing.assert_array_equal(np_t, o3_t.cpu().numpy())
 
 
 def test_tensor_from_to_numpy():
@@ -187,8 +198,8 @@ def test_tensor_from_to_numpy():
 
     c[0, 1] = 200
     r = np.array([[1., 200.], [1., 1.]])
-    np.testing.assert_equal(r, b.numpy())
-    np.testing.assert_equal(r, c)
+    np.testing.assert_array_equal(r, b.numpy())
+    np.testing.assert_array_equal(r, c)
 
     # a, b, c share memory
     a = np.array([[1., 1.], [1., 1.]])
@@ -198,24 +209,24 @@ def test_tensor_from_to_numpy():
     a[0, 0] = 100
     c[0, 1] = 200
     r = np.array([[100., 200.], [1., 1.]])
-    np.testing.assert_equal(r, a)
-    np.testing.assert_equal(r, b.numpy())
-    np.testing.assert_equal(r, c)
+    np.testing.assert_array_equal(r, a)
+    np.testing.assert_array_equal(r, b.numpy())
+    np.testing.assert_array_equal(r, c)
 
     # Special strides
     ran_t = np.random.randint(10, size=(10, 10)).astype(np.int32)
     src_t = ran_t[1:10:2, 1:10:3].T
     o3d_t = o3d.core.Tensor.from_numpy(src_t)  # Shared memory
     dst_t = o3d_t.numpy()
-    np.testing.assert_equal(dst_t, src_t)
+    np.testing.assert_array_equal(dst_t, src_t)
 
     dst_t[0, 0] = 100
-    np.testing.assert_equal(dst_t, src_t)
-    np.testing.assert_equal(dst_t, o3d_t.numpy())
+    np.testing.assert_array_equal(dst_t, src_t)
+    np.testing.assert_array_equal(dst_t, o3d_t.numpy())
 
     src_t[0, 1] = 200
-    np.testing.assert_equal(dst_t, src_t)
-    np.testing.assert_equal(dst_t, o3d_t.numpy())
+    np.testing.assert_array_equal(dst_t, src_t)
+    np.testing.assert_array_equal(dst_t, o3d_t.numpy())
 
 
 def test_tensor_to_numpy_scope():
@@ -227,7 +238,7 @@ def test_tensor_to_numpy_scope():
         return dst_t
 
     dst_t = get_dst_t()
-    np.testing.assert_equal(dst_t, src_t)
+    np.testing.assert_array_equal(dst_t, src_t)
 
 
 @pytest.mark.parametrize("device", core_test_utils.list_devices())
@@ -303,28 +314,33 @@ def test_tensor_numpy_to_open3d_to_pytorch():
 def test_binary_ew_ops(device):
     a = o3d.core.Tensor(np.array([4, 6, 8, 10, 12, 14]), device=device)
     b = o3d.core.Tensor(np.array([2, 3, 4, 5, 6, 7]), device=device)
-    np.testing.assert_equal((a + b).cpu().numpy(),
-                            np.array([6, 9, 12, 15, 18, 21]))
-    np.testing.assert_equal((a - b).cpu().numpy(), np.array([2, 3, 4, 5, 6, 7]))
-    np.testing.assert_equal((a * b).cpu().numpy(),
-                            np.array([8, 18, 32, 50, 72, 98]))
-    np.testing.assert_equal((a / b).cpu().numpy(), np.array([2, 2, 2, 2, 2, 2]))
-
-    a = o3d.core.Tensor(np.array([4, 6, 8, 10, 12, 14]), device=device)
-    a += b
-    np.testing.assert_equal(a.cpu().numpy(), np.array([6, 9, 12, 15, 18, 21]))
-
-    a = o3d.core.Tensor(np.array([4, 6, 8, 10, 12, 14]), device=device)
-    a -= b
-    np.testing.assert_equal(a.cpu().numpy(), np.array([2, 3, 4, 5, 6, 7]))
-
-    a = o3d.core.Tensor(np.array([4, 6, 8, 10, 12, 14]), device=device)
-    a *= b
-    np.testing.assert_equal(a.cpu().numpy(), np.array([8, 18, 32, 50, 72, 98]))
-
-    a = o3d.core.Tensor(np.array([4, 6, 8, 10, 12, 14]), device=device)
-    a //= b
-    np.testing.assert_equal(a.cpu().numpy(), np.array([2, 2, 2, 2, 2, 2]))
+    np.testing.assert_array_equal((a + b).cpu().numpy(),
+                                  np.array([6, 9, 12, 15, 18, 21]))
+    np.testing.assert_array_equal((a - b).cpu().numpy(),
+                                  np.array([2, 3, 4, 5, 6, 7]))
+    np.testing.assert_array_equal((a * b).cpu().numpy(),
+                                  np.array([8, 18, 32, 50, 72, 98]))
+    np.testing.assert_array_equal((a / b).cpu().numpy(),
+                                  np.array([2, 2, 2, 2, 2, 2]))
+
+    # In-place ops are applied to device-side copies of `a`.
+    c = a.to(a.dtype, copy=True)
+    c += b
+    np.testing.assert_array_equal(c.cpu().numpy(),
+                                  np.array([6, 9, 12, 15, 18, 21]))
+
+    c = a.to(a.dtype, copy=True)
+    c -= b
+    np.testing.assert_array_equal(c.cpu().numpy(), np.array([2, 3, 4, 5, 6, 7]))
+
+    c = a.to(a.dtype, copy=True)
+    c *= b
+    np.testing.assert_array_equal(c.cpu().numpy(),
+                                  np.array([8, 18, 32, 50, 72, 98]))
+
+    c = a.to(a.dtype, copy=True)
+    c //= b
+    np.testing.assert_array_equal(c.cpu().numpy(), np.array([2, 2, 2, 2, 2, 2]))
 
 
 @pytest.mark.parametrize("device", core_test_utils.list_devices())
@@ -340,155 +356,127 @@ def test_to(device):
     assert b.device == a.device
 
 
+@pytest.mark.parametrize("device", core_test_utils.list_devices())
+def test_cpu(device):
+    a = o3d.core.Tensor(np.array([0, 1, 2, 3, 4, 5]), device=device)
+    b = a.cpu()
+    assert b.device == o3d.core.Device("CPU:0")
+    np.testing.assert_equal(b.numpy(), np.array([0, 1, 2, 3, 4, 5]))
+
+    # No copy is performed if the tensor is already in CPU.
+    if device.get_type() == o3d.core.Device.DeviceType.CPU:
+        assert b.issame(a)
+    else:
+        assert not b.issame(a)
+
+
 @pytest.mark.parametrize("device", core_test_utils.list_devices())
 def test_unary_ew_ops(device):
     src_vals = np.array([0, 1, 2, 3, 4, 5]).astype(np.float32)
     src = o3d.core.Tensor(src_vals, device=device)
 
-    rtol = 1e-5
-    atol = 0
     np.testing.assert_allclose(src.sqrt().cpu().numpy(),
                                np.sqrt(src_vals),
-                               rtol=rtol,
-                               atol=atol)
+                               rtol=_RTOL,
+                               atol=_ATOL)
     np.testing.assert_allclose(src.sin().cpu().numpy(),
                                np.sin(src_vals),
-                               rtol=rtol,
-                               atol=atol)
+                               rtol=_RTOL,
+                               atol=_ATOL)
     np.testing.assert_allclose(src.cos().cpu().numpy(),
                                np.cos(src_vals),
-                               rtol=rtol,
-                               atol=atol)
+                               rtol=_RTOL,
+                               atol=_ATOL)
     np.testing.assert_allclose(src.neg().cpu().numpy(),
                                -src_vals,
-                               rtol=rtol,
-                               atol=atol)
+                               rtol=_RTOL,
+                               atol=_ATOL)
     np.testing.assert_allclose(src.exp().cpu().numpy(),
                                np.exp(src_vals),
-                               rtol=rtol,
-                               atol=atol)
-
-
+                               rtol=_RTOL,
+                               atol=_ATOL)
+
+
+@pytest.fixture(scope="module")
+def small_src_tensor():
+    """
+    Returns the (2, 3, 4) arange source shared by the indexing tests, and a
+    dict mapping the device string to the corresponding Open3D tensor. Tests
+    that modify the source must work on copies.
+    """
+    np_src = np.arange(24).reshape((2, 3, 4))
+    np_src.setflags(write=False)
+    o3_srcs = {
+        str(device): o3d.core.Tensor(np_src, device=device)
+        for device in core_test_utils.list_devices()
+    }
+    return np_src, o3_srcs
+
+
+# Basic slicing keys shared by the getitem and setitem tests.
+_SLICE_KEYS = [
+    np.s_[:],
+    np.s_[0],
+    np.s_[0, 1],
+    np.s_[0, :],
+    np.s_[0, 1:3],
+    np.s_[0, :, :-2],
+    np.s_[0, 1:3, 2],
+    np.s_[0, 1:-1, 2],
+    np.s_[0, 1:3, 0:4:2],
+    np.s_[0, 1:3, 0:-1:2],
+    np.s_[0, 1, :],
+]
+
+
+@pytest.mark.parametrize("key", _SLICE_KEYS)
 @pytest.mark.parametrize("device", core_test_utils.list_devices())
-def test_getitem(device):
-    np_t = np.array(range(24)).reshape((2, 3, 4))
-    o3_t = o3d.core.Tensor(np_t, device=device)
-
-    np.testing.assert_equal(o3_t[:].cpu().numpy(), np_t[:])
-    np.testing.assert_equal(o3_t[0].cpu().numpy(), np_t[0])
-    np.testing.assert_equal(o3_t[0, 1].cpu().numpy(), np_t[0, 1])
-    np.testing.assert_equal(o3_t[0, :].cpu().numpy(), np_t[0, :])
-    np.testing.assert_equal(o3_t[0, 1:3].cpu().numpy(), np_t[0, 1:3])
-    np.testing.assert_equal(o3_t[0, :, :-2].cpu().numpy(), np_t[0, :, :-2])
-    np.testing.assert_equal(o3_t[0, 1:3, 2].cpu().numpy(), np_t[0, 1:3, 2])
-    np.testing.assert_equal(o3_t[0, 1:-1, 2].cpu().numpy(), np_t[0, 1:-1, 2])
-    np.testing.assert_equal(o3_t[0, 1:3, 0:4:2].cpu().numpy(),
-                            np_t[0, 1:3, 0:4:2])
-    np.testing.assert_equal(o3_t[0, 1:3, 0:-1:2].cpu().numpy(),
-                            np_t[0, 1:3, 0:-1:2])
-    np.testing.assert_equal(o3_t[0, 1, :].cpu().numpy(), np_t[0, 1, :])
-
-    # Slice the slice
-    np.testing.assert_equal(o3_t[0:2, 1:3, 0:4][0:1, 0:2, 2:3].cpu().numpy(),
-                            np_t[0:2, 1:3, 0:4][0:1, 0:2, 2:3])
+def test_getitem(key, device, small_src_tensor):
+    np_t, o3_ts = small_src_tensor
+    o3_t = o3_ts[str(device)]
 
+    np.testing.assert_equal(o3_t[key].cpu().numpy(), np_t[key])
 
-@pytest.mark.parametrize("device", core_test_utils.list_devices())
-def test_setitem(device):
-    np_ref = np.array(range(24)).reshape((2, 3, 4))
-    o3_ref = o3d.core.Tensor(np_ref, device=device)
 
-    np_t = np_ref.copy()
-    o3_t = o3d.core.Tensor(np_t, device=device)
-    np_fill_t = np.random.rand(*np_t[:].shape)
-    o3_fill_t = o3d.core.Tensor(np_fill_t, device=device)
-    np_t[:] = np_fill_t
-    o3_t[:] = o3_fill_t
-    np.testing.assert_equal(o3_t.cpu().numpy(), np_t)
-
-    np_t = np_ref.copy()
-    o3_t = o3d.core.Tensor(np_t, device=device)
-    np_fill_t = np.random.rand(*np_t[0].shape)
-    o3_fill_t = o3d.core.Tensor(np_fill_t, device=device)
-    np_t[0] = np_fill_t
-    o3_t[0] = o3_fill_t
-    np.testing.assert_equal(o3_t.cpu().numpy(), np_t)
-
-    np_t = np_ref.copy()
-    o3_t = o3d.core.Tensor(np_t, device=device)
-    np_fill_t = np.random.rand(*np_t[0, 1].shape)
-    o3_fill_t = o3d.core.Tensor(np_fill_t, device=device)
-    np_t[0, 1] = np_fill_t
-    o3_t[0, 1] = o3_fill_t
-    np.testing.assert_equal(o3_t.cpu().numpy(), np_t)
+@pytest.mark.parametrize("device", core_test_utils.list_devices())
+def test_getitem_slice_of_slice(device, small_src_tensor):
+    np_t, o3_ts = small_src_tensor
+    o3_t = o3_ts[str(device)]
 
-    np_t = np_ref.copy()
-    o3_t = o3d.core.Tensor(np_t, device=device)
-    np_fill_t = np.random.rand(*np_t[0, :].shape)
-    o3_fill_t = o3d.core.Tensor(np_fill_t, device=device)
-    np_t[0, :] = np_fill_t
-    o3_t[0, :] = o3_fill_t
-    np.testing.assert_equal(o3_t.cpu().numpy(), np_t)
+    np.testing.assert_equal(o3_t[0:2, 1:3, 0:4][0:1, 0:2, 2:3].cpu().numpy(),
+                            np_t[0:2, 1:3, 0:4][0:1, 0:2, 2:3])
 
-    np_t = np_ref.copy()
-    o3_t = o3d.core.Tensor(np_t, device=device)
-    np_fill_t = np.random.rand(*np_t[0, 1:3].shape)
-    o3_fill_t = o3d.core.Tensor(np_fill_t, device=device)
-    np_t[0, 1:3] = np_fill_t
-    o3_t[0, 1:3] = o3_fill_t
-    np.testing.assert_equal(o3_t.cpu().numpy(), np_t)
 
-    np_t = np_ref.copy()
-    o3_t = o3d.core.Tensor(np_t, device=device)
-    np_fill_t = np.random.rand(*np_t[0, :, :-2].shape)
-    o3_fill_t = o3d.core.Tensor(np_fill_t, device=device)
-    np_t[0, :, :-2] = np_fill_t
-    o3_t[0, :, :-2] = o3_fill_t
-    np.testing.assert_equal(o3_t.cpu().numpy(), np_t)
+# Source of the fill values of the setitem tests. The fill values of each case
+# are a slice of it, instead of being drawn from the RNG for every case.
+_SETITEM_FILL_POOL = np.random.rand(24)
 
-    np_t = np_ref.copy()
-    o3_t = o3d.core.Tensor(np_t, device=device)
-    np_fill_t = np.random.rand(*np_t[0, 1:3, 2].shape)
-    o3_fill_t = o3d.core.Tensor(np_fill_t, device=device)
-    np_t[0, 1:3, 2] = np_fill_t
-    o3_t[0, 1:3, 2] = o3_fill_t
-    np.testing.assert_equal(o3_t.cpu().numpy(), np_t)
 
-    np_t = np_ref.copy()
-    o3_t = o3d.core.Tensor(np_t, device=device)
-    np_fill_t = np.random.rand(*np_t[0, 1:-1, 2].shape)
-    o3_fill_t = o3d.core.Tensor(np_fill_t, device=device)
-    np_t[0, 1:-1, 2] = np_fill_t
-    o3_t[0, 1:-1, 2] = o3_fill_t
-    np.testing.assert_equal(o3_t.cpu().numpy(), np_t)
+def _setitem_fill(shape):
+    return _SETITEM_FILL_POOL[:int(np.prod(shape))].reshape(shape)
 
-    np_t = np_ref.copy()
-    o3_t = o3d.core.Tensor(np_t, device=device)
-    np_fill_t = np.random.rand(*np_t[0, 1:3, 0:4:2].shape)
-    o3_fill_t = o3d.core.Tensor(np_fill_t, device=device)
-    np_t[0, 1:3, 0:4:2] = np_fill_t
-    o3_t[0, 1:3, 0:4:2] = o3_fill_t
-    np.testing.assert_equal(o3_t.cpu().numpy(), np_t)
 
-    np_t = np_ref.copy()
-    o3_t = o3d.core.Tensor(np_t, device=device)
-    np_fill_t = np.random.rand(*np_t[0, 1:3, 0:-1:2].shape)
+@pytest.mark.parametrize("key", _SLICE_KEYS)
+@pytest.mark.parametrize("device", core_test_utils.list_devices())
+def test_setitem(key, device, small_src_tensor):
+    np_src, o3_srcs = small_src_tensor
+    np_t = np_src.copy()
+    o3_t = o3_srcs[str(device)]
+    o3_t = o3_t.to(o3_t.dtype, copy=True)
+    np_fill_t = _setitem_fill(np_t[key].shape)
     o3_fill_t = o3d.core.Tensor(np_fill_t, device=device)
-    np_t[0, 1:3, 0:-1:2] = np_fill_t
-    o3_t[0, 1:3, 0:-1:2] = o3_fill_t
+    np_t[key] = np_fill_t
+    o3_t[key] = o3_fill_t
     np.testing.assert_equal(o3_t.cpu().numpy(), np_t)
 
-    np_t = np_ref.copy()
-    o3_t = o3d.core.Tensor(np_t, device=device)
-    np_fill_t = np.random.rand(*np_t[0, 1, :].shape)
-    o3_fill_t = o3d.core.Tensor(np_fill_t, device=device)
-    np_t[0, 1, :] = np_fill_t
-    o3_t[0, 1, :] = o3_fill_t
-    np.testing.assert_equal(o3_t.cpu().numpy(), np_t)
 
-    np_t = np_ref.copy()
-    o3_t = o3d.core.Tensor(np_t, device=device)
-    np_fill_t = np.random.rand(*np_t[0:2, 1:3, 0:4][0:1, 0:2, 2:3].shape)
+@pytest.mark.parametrize("device", core_test_utils.list_devices())
+def test_setitem_slice_of_slice(device, small_src_tensor):
+    np_src, o3_srcs = small_src_tensor
+    np_t = np_src.copy()
+    o3_t = o3_srcs[str(device)]
+    o3_t = o3_t.to(o3_t.dtype, copy=True)
+    np_fill_t = _setitem_fill(np_t[0:2, 1:3, 0:4][0:1, 0:2, 2:3].shape)
     o3_fill_t = o3d.core.Tensor(np_fill_t, device=device)
     np_t[0:2, 1:3, 0:4][0:1, 0:2, 2:3] = np_fill_t
     o3_t[0:2, 1:3, 0:4][0:1, 0:2, 2:3] = o3_fill_t
@@ -503,17 +491,37 @@ def test_cast_to_py_tensor(device):
     assert isinstance(c, o3d.core.Tensor)  # Not o3d.open3d-pybind.Tensor
 
 
+@pytest.fixture(scope="module")
+def reduction_src():
+    """
+    Returns the shared source of the reduction tests: a shuffled Int64 and a
+    Float32 NumPy array with the same values, and for each of them a dict
+    mapping the device string to the corresponding Open3D tensor.
+    """
+    np_src = np.arange(24)
+    np.random.shuffle(np_src)
+    np_src = np_src.reshape((2, 3, 4))
+    devices = core_test_utils.list_devices()
+    srcs = {}
+    for key, np_t in [("int", np_src), ("float", np_src.astype(np.float32))]:
+        o3_ts = {str(d): o3d.core.Tensor(np_t, device=d) for d in devices}
+        srcs[key] = (np_t, o3_ts)
+    return srcs
+
+
+@pytest.mark.parametrize("op_name", ["sum", "mean", "prod", "min", "max"])
 @pytest.mark.parametrize(
     "dim",
     [0, 1, 2, (), (0,), (1,), (2,), (0, 1), (0, 2), (1, 2), (0, 1, 2), None])
 @pytest.mark.parametrize("keepdim", [True, False])
 @pytest.mark.parametrize("device", core_test_utils.list_devices())
-def test_reduction_sum(dim, keepdim, device):
-    np_src = np.array(range(24)).reshape((2, 3, 4))
-    o3_src = o3d.core.Tensor(np_src, device=device)
+def test_reduction_op(op_name, dim, keepdim, device, reduction_src):
+    # Mean is checked on floats, as NumPy's mean of integers is a float.
+    np_src, o3_srcs = reduction_src["float" if op_name == "mean" else "int"]
+    o3_src = o3_srcs[str(device)]
 
-    np_dst = np_src.sum(axis=dim, keepdims=keepdim)
-    o3_dst = o3_src.sum(dim=dim, keepdim=keepdim)
+    np_dst = getattr(np_src, op_name)(axis=dim, keepdims=keepdim)
+    o3_dst = getattr(o3_src, op_name)(dim=dim, keepdim=keepdim)
     np.testing.assert_allclose(o3_dst.cpu().numpy(), np_dst)
 
 
@@ -538,70 +546,10 @@ def test_reduction_special_shapes(shape_and_axis, keepdim, device):
     np.testing.assert_equal(o3_dst.cpu().numpy(), np_dst)
 
 
-@pytest.mark.parametrize(
-    "dim",
-    [0, 1, 2, (), (0,), (1,), (2,), (0, 1), (0, 2), (1, 2), (0, 1, 2), None])
-@pytest.mark.parametrize("keepdim", [True, False])
-@pytest.mark.parametrize("device", core_test_utils.list_devices())
-def test_reduction_mean(dim, keepdim, device):
-    np_src = np.array(range(24)).reshape((2, 3, 4)).astype(np.float32)
-    o3_src = o3d.core.Tensor(np_src, device=device)
-
-    np_dst = np_src.mean(axis=dim, keepdims=keepdim)
-    o3_dst = o3_src.mean(dim=dim, keepdim=keepdim)
-    np.testing.assert_allclose(o3_dst.cpu().numpy(), np_dst)
-
-
-@pytest.mark.parametrize(
-    "dim",
-    [0, 1, 2, (), (0,), (1,), (2,), (0, 1), (0, 2), (1, 2), (0, 1, 2), None])
-@pytest.mark.parametrize("keepdim", [True, False])
-@pytest.mark.parametrize("device", core_test_utils.list_devices())
-def test_reduction_prod(dim, keepdim, device):
-    np_src = np.array(range(24)).reshape((2, 3, 4))
-    o3_src = o3d.core.Tensor(np_src, device=device)
-
-    np_dst = np_src.prod(axis=dim, keepdims=keepdim)
-    o3_dst = o3_src.prod(dim=dim, keepdim=keepdim)
-    np.testing.assert_allclose(o3_dst.cpu().numpy(), np_dst)
-
-
-@pytest.mark.parametrize(
-    "dim",
-    [0, 1, 2, (), (0,), (1,), (2,), (0, 1), (0, 2), (1, 2), (0, 1, 2), None])
-@pytest.mark.parametrize("keepdim", [True, False])
-@pytest.mark.parametrize("device", core_test_utils.list_devices())
-def test_reduction_min(dim, keepdim, device):
-    np_src = np.array(range(24))
-    np.random.shuffle(np_src)
-    np_src = np_src.reshape((2, 3, 4))
-    o3_src = o3d.core.Tensor(np_src, device=device)
-
-    np_dst = np_src.min(axis=dim, keepdims=keepdim)
-    o3_dst = o3_src.min(dim=dim, keepdim=keepdim)
-    np.testing.assert_allclose(o3_dst.cpu().numpy(), np_dst)
-
-
-@pytest.mark.parametrize(
-    "dim",
-    [0, 1, 2, (), (0,), (1,), (2,), (0, 1), (0, 2), (1, 2), (0, 1, 2), None])
-@pytest.mark.parametrize("keepdim", [True, False])
-@pytest.mark.parametrize("device", core_test_utils.list_devices())
-def test_reduction_max(dim, keepdim, device):
-    np_src = np.array(range(24))
-    np.random.shuffle(np_src)
-    np_src = np_src.reshape((2, 3, 4))
-    o3_src = o3d.core.Tensor(np_src, device=device)
-
-    np_dst = np_src.max(axis=dim, keepdims=keepdim)
-    o3_dst = o3_src.max(dim=dim, keepdim=keepdim)
-    np.testing.assert_allclose(o3_dst.cpu().numpy(), np_dst)
-
-
 @pytest.mark.parametrize("dim", [0, 1, 2, None])
 @pytest.mark.parametrize("device", core_test_utils.list_devices())
 def test_reduction_argmin_argmax(dim, device):
-    np_src = np.array(range(24))
+    np_src = np.arange(24)
     np.random.shuffle(np_src)
     np_src = np_src.reshape((2, 3, 4))
     o3_src = o3d.core.Tensor(np_src, device=device)
@@ -616,9 +564,9 @@ def test_reduction_argmin_argmax(dim, device):
 
 
 @pytest.mark.parametrize("device", core_test_utils.list_devices())
-def test_advanced_index_get_mixed(device):
-    np_src = np.array(range(24)).reshape((2, 3, 4))
-    o3_src = o3d.core.Tensor(np_src, device=device)
+def test_advanced_index_get_mixed(device, small_src_tensor):
+    np_src, o3_srcs = small_src_tensor
+    o3_src = o3_srcs[str(device)]
 
     np_dst = np_src[1, 0:2, [1, 2]]
     o3_dst = o3_src[1, 0:2, [1, 2]]
@@ -634,7 +582,7 @@ def test_advanced_index_get_mixed(device):
                             np_src[(1, 2), [1, 2]])
 
     # Complex case: interleaving slice and advanced indexing
-    np_src = np.array(range(120)).reshape((2, 3, 4, 5))
+    np_src = np.arange(120).reshape((2, 3, 4, 5))
     o3_src = o3d.core.Tensor(np_src, device=device)
     o3_dst = o3_src[1, [[1, 2], [2, 1]], 0:4:2, [3, 4]]
     np_dst = np_src[1, [[1, 2], [2, 1]], 0:4:2, [3, 4]]
@@ -642,9 +590,11 @@ def test_advanced_index_get_mixed(device):
 
 
 @pytest.mark.parametrize("device", core_test_utils.list_devices())
-def test_advanced_index_set_mixed(device):
-    np_src = np.array(range(24)).reshape((2, 3, 4))
-    o3_src = o3d.core.Tensor(np_src, device=device)
+def test_advanced_index_set_mixed(device, small_src_tensor):
+    np_src, o3_srcs = small_src_tensor
+    np_src = np_src.copy()
+    o3_src = o3_srcs[str(device)]
+    o3_src = o3_src.to(o3_src.dtype, copy=True)
 
     np_fill = np.array(([[100, 200], [300, 400]]))
     o3_fill = o3d.core.Tensor(np_fill, device=device)
@@ -654,7 +604,7 @@ def test_advanced_index_set_mixed(device):
     np.testing.assert_equal(o3_src.cpu().numpy(), np_src)
 
     # Complex case: interleaving slice and advanced indexing
-    np_src = np.array(range(120)).reshape((2, 3, 4, 5))
+    np_src = np.arange(120).reshape((2, 3, 4, 5))
     o3_src = o3d.core.Tensor(np_src, device=device)
     fill_shape = np_src[1, [[1, 2], [2, 1]], 0:4:2, [3, 4]].shape
     np_fill_val = np.random.randint(5000, size=fill_shape).astype(np_src.dtype)
@@ -664,10 +614,14 @@ def test_advanced_index_set_mixed(device):
     np.testing.assert_equal(o3_src.cpu().numpy(), np_src)
 
 
-@pytest.mark.parametrize("device", core_test_utils.list_devices())
-def test_tensor_from_to_pytorch(device):
-    if not core_test_utils.torch_available():
-        return
+# Source and NumPy references of test_unary_elementwise, computed once for all
+# devices.
+_UNARY_NP_T = np.array([-3, -2, -1, 9, 1, 2, 3]).astype(np.float32)
+with np.errstate(invalid='ignore'):  # e.g. sqrt of negative should be -nan
+    _UNARY_REF = {
+        np_func_name: getattr(np, np_func_name)(_UNARY_NP_T)
+        for np_func_name in ("sqrt", "sin", "cos", "negative", "exp", "abs")
+    }
 
 
 @pytest.mark.parametrize("np_func_name,o3_func_name", [("sqrt", "sqrt"),
@@ -678,20 +632,17 @@ def test_tensor_from_to_pytorch(device):
                                                        ("abs", "abs")])
 @pytest.mark.parametrize("device", core_test_utils.list_devices())
 def test_unary_elementwise(np_func_name, o3_func_name, device):
-    np_t = np.array([-3, -2, -1, 9, 1, 2, 3]).astype(np.float32)
-    o3_t = o3d.core.Tensor(np_t, device=device)
+    o3_t = o3d.core.Tensor(_UNARY_NP_T, device=device)
+    np_ref = _UNARY_REF[np_func_name]
 
     # Test non-in-place version
-    np.seterr(invalid='ignore')  # e.g. sqrt of negative should be -nan
     np.testing.assert_allclose(
-        getattr(o3_t, o3_func_name)().cpu().numpy(),
-        getattr(np, np_func_name)(np_t))
+        getattr(o3_t, o3_func_name)().cpu().numpy(), np_ref)
 
     # Test in-place version
     o3_func_name_inplace = o3_func_name + "_"
     getattr(o3_t, o3_func_name_inplace)()
-    np.testing.assert_allclose(o3_t.cpu().numpy(),
-                               getattr(np, np_func_name)(np_t))
+    np.testing.assert_allclose(o3_t.cpu().numpy(), np_ref)
 
 
 @pytest.mark.parametrize("device", core_test_utils.list_devices())
@@ -703,15 +654,29 @@ def test_logical_ops(device):
 
     o3_r = o3_a.logical_and(o3_b)
     np_r = np.logical_and(np_a, np_b)
-    np.testing.assert_equal(o3_r.cpu().numpy(), np_r)
+    np.testing.assert_array_equal(o3_r.cpu().numpy(), np_r)
 
     o3_r = o3_a.logical_or(o3_b)
     np_r = np.logical_or(np_a, np_b)
-    np.testing.assert_equal(o3_r.cpu().numpy(), np_r)
+    np.testing.assert_array_equal(o3_r.cpu().numpy(), np_r)
 
     o3_r = o3_a.logical_xor(o3_b)
     np_r = np.logical_xor(np_a, np_b)
-    np.testing.assert_equal(o3_r.cpu().numpy(), np_r)
+    np.testing.assert_array_equal(o3_r.cpu().numpy(), np_r)
+
+
+def _to_numpy_batched(tensors, shape):
+    """
+    Copies tensors of the same shape, dtype and device to host at once. The
+    tensors are gathered in one device tensor of shape (len(tensors), *shape),
+    which is returned as a Numpy array.
+    """
+    batch = o3d.core.Tensor.empty((len(tensors),) + tuple(shape),
+                                  tensors[0].dtype,
+                                  device=tensors[0].device)
+    for i, t in enumerate(tensors):
+        batch[i] = t
+    return batch.cpu().numpy()
 
 
 @pytest.mark.parametrize("device", core_test_utils.list_devices())
@@ -721,12 +686,17 @@ def test_comparision_ops(device):
     o3_a = o3d.core.Tensor(np_a, device=device)
     o3_b = o3d.core.Tensor(np_b, device=device)
 
-    np.testing.assert_equal((o3_a > o3_b).cpu().numpy(), np_a > np_b)
-    np.testing.assert_equal((o3_a >= o3_b).cpu().numpy(), np_a >= np_b)
-    np.testing.assert_equal((o3_a < o3_b).cpu().numpy(), np_a < np_b)
-    np.testing.assert_equal((o3_a <= o3_b).cpu().numpy(), np_a <= np_b)
-    np.testing.assert_equal((o3_a == o3_b).cpu().numpy(), np_a == np_b)
-    np.testing.assert_equal((o3_a != o3_b).cpu().numpy(), np_a != np_b)
+    # The results of all comparisons are brought to host at once.
+    o3_rs = [
+        o3_a > o3_b, o3_a >= o3_b, o3_a < o3_b, o3_a <= o3_b, o3_a == o3_b,
+        o3_a != o3_b
+    ]
+    np_rs = [
+        np_a > np_b, np_a >= np_b, np_a < np_b, np_a <= np_b, np_a == np_b,
+        np_a != np_b
+    ]
+    np.testing.assert_array_equal(_to_numpy_batched(o3_rs, np_a.shape),
+                                  np.stack(np_rs))
 
 
 @pytest.mark.parametrize("device", core_test_utils.list_devices())
@@ -734,265 +704,349 @@ def test_non_zero(device):
     np_x = np.array([[3, 0, 0], [0, 4, 0], [5, 6, 0]])
     np_nonzero_tuple = np.nonzero(np_x)
     o3_x = o3d.core.Tensor(np_x, device=device)
+    np_nonzero = np.stack(np_nonzero_tuple)
+
     o3_nonzero_tuple = o3_x.nonzero(as_tuple=True)
-    for np_t, o3_t in zip(np_nonzero_tuple, o3_nonzero_tuple):
-        np.testing.assert_equal(np_t, o3_t.cpu().numpy())
+    assert len(o3_nonzero_tuple) == len(np_nonzero_tuple)
+    np.testing.assert_array_equal(
+        _to_numpy_batched(o3_nonzero_tuple, np_nonzero_tuple[0].shape),
+        np_nonzero)
+
+    # Without as_tuple, the indices are a single tensor of shape
+    # {num_dims, num_non_zeros}.
+    np.testing.assert_array_equal(o3_x.nonzero().cpu().numpy(), np_nonzero)
 
 
 @pytest.mark.parametrize("device", core_test_utils.list_devices())
 def test_boolean_advanced_indexing(device):
+    # The masks are computed once with Numpy and shared by both sides.
     np_a = np.array([1, -1, -2, 3])
     o3_a = o3d.core.Tensor(np_a, device=device)
-    np_a[np_a < 0] = 0
-    o3_a[o3_a < 0] = 0
-    np.testing.assert_equal(np_a, o3_a.cpu().numpy())
+    np_mask = np_a < 0
+    np_a[np_mask] = 0
+    o3_a[o3d.core.Tensor(np_mask, device=device)] = 0
+    np.testing.assert_array_equal(np_a, o3_a.cpu().numpy())
 
     np_x = np.array([[0, 1], [1, 1], [2, 2]])
-    np_row_sum = np.array([1, 2, 4])
-    np_y = np_x[np_row_sum <= 2, :]
+    np_row_mask = np.array([1, 2, 4]) <= 2
+    np_y = np_x[np_row_mask, :]
     o3_x = o3d.core.Tensor(np_x, device=device)
-    o3_row_sum = o3d.core.Tensor(np_row_sum)
-    o3_y = o3_x[o3_row_sum <= 2, :]
-    np.testing.assert_equal(np_y, o3_y.cpu().numpy())
-
-
-@pytest.mark.parametrize("device", core_test_utils.list_devices())
-def test_scalar_op(device):
+    o3_y = o3_x[o3d.core.Tensor(np_row_mask), :]
+    np.testing.assert_array_equal(np_y, o3_y.cpu().numpy())
+
+
+_SCALAR_OP_FLOAT_DTYPES = [o3d.core.Dtype.Float32, o3d.core.Dtype.Float64]
+_SCALAR_OP_DTYPES = _SCALAR_OP_FLOAT_DTYPES + [
+    o3d.core.Dtype.Int32, o3d.core.Dtype.Int64
+]
+
+# Numeric sources of the scalar op tests.
+_SCALAR_OP_NP_SRCS = {
+    "ones": np.ones((2, 3)),
+    "twos": np.full((2, 3), 2),
+    "twenties": np.full((2, 3), 20),
+    "signs": np.array([-1, 0, 1]),
+}
+for _np_src in _SCALAR_OP_NP_SRCS.values():
+    _np_src.setflags(write=False)
+
+
+@pytest.fixture(scope="module")
+def scalar_op_srcs():
+    """
+    Source tensors of the scalar op tests, created once per device and dtype.
+    The tests only read them, in-place ops are applied to device-side copies.
+    """
+    srcs = {}
+    for device in core_test_utils.list_devices():
+        for dtype in _SCALAR_OP_DTYPES:
+            srcs[str(device), dtype] = {
+                name: o3d.core.Tensor(np_src, dtype, device)
+                for name, np_src in _SCALAR_OP_NP_SRCS.items()
+            }
+        srcs[str(device), o3d.core.Dtype.Bool] = {
+            "bools": o3d.core.Tensor([True, False], device=device),
+        }
+    return srcs
+
+
+@pytest.fixture(scope="module")
+def scalar_op_work(scalar_op_srcs):
+    """
+    Work tensors of the in-place scalar op tests, one per source tensor. A test
+    resets its work tensor from the source, which is a device-side copy into
+    the existing buffer rather than a new allocation.
+    """
+    work = {}
+    for key, srcs in scalar_op_srcs.items():
+        work[key] = {name: t.to(t.dtype, copy=True) for name, t in srcs.items()}
+    return work
+
+
+def _scalar_op_params(cases, expected_of):
+    """
+    Expands the scalar op cases (description, source, ...) to pytest params
+    (dtype, source, ...). The "bools" source is Bool only. The numeric sources
+    are tested with all _SCALAR_OP_DTYPES, except for cases with fractional
+    results, which are only tested with floating point dtypes.
+    """
+    params = []
+    for case in cases:
+        if case[1] == "bools":
+            dtypes = [o3d.core.Dtype.Bool]
+        elif np.all(np.mod(expected_of(case), 1) == 0):
+            dtypes = _SCALAR_OP_DTYPES
+        else:
+            dtypes = _SCALAR_OP_FLOAT_DTYPES
+        params += [
+            pytest.param(dtype, *case[1:], id="{}-{}".format(case[0], dtype))
+            for dtype in dtypes
+        ]
+    return params
+
+
+# Expected values of the scalar op tests on the (2, 3) sources, shared by all
+# cases. Each one is a read-only broadcast view of the scalar, such that a test
+# can't modify it by accident.
+_SCALAR_REF = {
+    k: np.broadcast_to(np.asarray(k), (2, 3))
+    for k in (-2, -1, 0, 0.5, 2, 2.5, 3, 4, 5, 10, 20, 200)
+}
+
+# (description, source, op, expected). The operator forms of the ops are
+# covered by _SCALAR_OPERATOR_CASES.
+_SCALAR_OP_CASES = [
     # +
-    a = o3d.core.Tensor.ones((2, 3), o3d.core.Dtype.Float32, device=device)
-    b = a.add(1)
-    np.testing.assert_equal(b.cpu().numpy(), np.full((2, 3), 2))
-    b = a + 1
-    np.testing.assert_equal(b.cpu().numpy(), np.full((2, 3), 2))
-    b = 1 + a
-    np.testing.assert_equal(b.cpu().numpy(), np.full((2, 3), 2))
-    b = a + True
-    np.testing.assert_equal(b.cpu().numpy(), np.full((2, 3), 2))
-
-    # +=
-    a = o3d.core.Tensor.ones((2, 3), o3d.core.Dtype.Float32, device=device)
-    a.add_(1)
-    np.testing.assert_equal(a.cpu().numpy(), np.full((2, 3), 2))
-    a += 1
-    np.testing.assert_equal(a.cpu().numpy(), np.full((2, 3), 3))
-    a += True
-    np.testing.assert_equal(a.cpu().numpy(), np.full((2, 3), 4))
-
+    ("a.add(1)", "ones", lambda a: a.add(1), _SCALAR_REF[2]),
     # -
-    a = o3d.core.Tensor.ones((2, 3), o3d.core.Dtype.Float32, device=device)
-    b = a.sub(1)
-    np.testing.assert_equal(b.cpu().numpy(), np.full((2, 3), 0))
-    b = a - 1
-    np.testing.assert_equal(b.cpu().numpy(), np.full((2, 3), 0))
-    b = 10 - a
-    np.testing.assert_equal(b.cpu().numpy(), np.full((2, 3), 9))
-    b = a - True
-    np.testing.assert_equal(b.cpu().numpy(), np.full((2, 3), 0))
-
-    # -=
-    a = o3d.core.Tensor.ones((2, 3), o3d.core.Dtype.Float32, device=device)
-    a.sub_(1)
-    np.testing.assert_equal(a.cpu().numpy(), np.full((2, 3), 0))
-    a -= 1
-    np.testing.assert_equal(a.cpu().numpy(), np.full((2, 3), -1))
-    a -= True
-    np.testing.assert_equal(a.cpu().numpy(), np.full((2, 3), -2))
-
+    ("a.sub(1)", "ones", lambda a: a.sub(1), _SCALAR_REF[0]),
     # *
-    a = o3d.core.Tensor.full((2, 3), 2, o3d.core.Dtype.Float32, device=device)
-    b = a.mul(10)
-    np.testing.assert_equal(b.cpu().numpy(), np.full((2, 3), 20))
-    b = a * 10
-    np.testing.assert_equal(b.cpu().numpy(), np.full((2, 3), 20))
-    b = 10 * a
-    np.testing.assert_equal(b.cpu().numpy(), np.full((2, 3), 20))
-    b = a * True
-    np.testing.assert_equal(b.cpu().numpy(), np.full((2, 3), 2))
-
-    # *=
-    a = o3d.core.Tensor.full((2, 3), 2, o3d.core.Dtype.Float32, device=device)
-    a.mul_(10)
-    np.testing.assert_equal(a.cpu().numpy(), np.full((2, 3), 20))
-    a *= 10
-    np.testing.assert_equal(a.cpu().numpy(), np.full((2, 3), 200))
-    a *= True
-    np.testing.assert_equal(a.cpu().numpy(), np.full((2, 3), 200))
-
+    ("a.mul(10)", "twos", lambda a: a.mul(10), _SCALAR_REF[20]),
     # /
-    a = o3d.core.Tensor.full((2, 3), 20, o3d.core.Dtype.Float32, device=device)
-    b = a.div(2)
-    np.testing.assert_equal(b.cpu().numpy(), np.full((2, 3), 10))
-    b = a / 2
-    np.testing.assert_equal(b.cpu().numpy(), np.full((2, 3), 10))
-    b = a // 2
-    np.testing.assert_equal(b.cpu().numpy(), np.full((2, 3), 10))
-    b = 10 / a
-    np.testing.assert_equal(b.cpu().numpy(), np.full((2, 3), 0.5))
-    b = 10 // a
-    np.testing.assert_equal(b.cpu().numpy(), np.full((2, 3), 0.5))
-    b = a / True
-    np.testing.assert_equal(b.cpu().numpy(), np.full((2, 3), 20))
-
-    # /=
-    a = o3d.core.Tensor.full((2, 3), 20, o3d.core.Dtype.Float32, device=device)
-    a.div_(2)
-    np.testing.assert_equal(a.cpu().numpy(), np.full((2, 3), 10))
-    a /= 2
-    np.testing.assert_equal(a.cpu().numpy(), np.full((2, 3), 5))
-    a //= 2
-    np.testing.assert_equal(a.cpu().numpy(), np.full((2, 3), 2.5))
-    a /= True
-    np.testing.assert_equal(a.cpu().numpy(), np.full((2, 3), 2.5))
-
+    ("a.div(2)", "twenties", lambda a: a.div(2), _SCALAR_REF[10]),
+    # True div and floor div are the same for Tensor.
+    ("10 // a", "twenties", lambda a: 10 // a, _SCALAR_REF[0.5]),
     # logical_and
-    a = o3d.core.Tensor([True, False], device=device)
-    np.testing.assert_equal(
-        a.logical_and(True).cpu().numpy(), np.array([True, False]))
-    np.testing.assert_equal(
-        a.logical_and(5).cpu().numpy(), np.array([True, False]))
-    np.testing.assert_equal(
-        a.logical_and(False).cpu().numpy(), np.array([False, False]))
-    np.testing.assert_equal(
-        a.logical_and(0).cpu().numpy(), np.array([False, False]))
-
-    # logical_and_
-    a = o3d.core.Tensor([True, False], device=device)
-    a.logical_and_(True)
-    np.testing.assert_equal(a.cpu().numpy(), np.array([True, False]))
-    a = o3d.core.Tensor([True, False], device=device)
-    a.logical_and_(5)
-    np.testing.assert_equal(a.cpu().numpy(), np.array([True, False]))
-    a = o3d.core.Tensor([True, False], device=device)
-    a.logical_and_(False)
-    np.testing.assert_equal(a.cpu().numpy(), np.array([False, False]))
-    a.logical_and_(0)
-    np.testing.assert_equal(a.cpu().numpy(), np.array([False, False]))
-
+    ("a.logical_and(True)", "bools", lambda a: a.logical_and(True),
+     np.array([True, False])),
+    ("a.logical_and(5)", "bools", lambda a: a.logical_and(5),
+     np.array([True, False])),
+    ("a.logical_and(False)", "bools", lambda a: a.logical_and(False),
+     np.array([False, False])),
+    ("a.logical_and(0)", "bools", lambda a: a.logical_and(0),
+     np.array([False, False])),
     # logical_or
-    a = o3d.core.Tensor([True, False], device=device)
-    np.testing.assert_equal(
-        a.logical_or(True).cpu().numpy(), np.array([True, True]))
-    np.testing.assert_equal(
-        a.logical_or(5).cpu().numpy(), np.array([True, True]))
-    np.testing.assert_equal(
-        a.logical_or(False).cpu().numpy(), np.array([True, False]))
-    np.testing.assert_equal(
-        a.logical_or(0).cpu().numpy(), np.array([True, False]))
+    ("a.logical_or(True)", "bools", lambda a: a.logical_or(True),
+     np.array([True, True])),
+    ("a.logical_or(5)", "bools", lambda a: a.logical_or(5),
+     np.array([True, True])),
+    ("a.logical_or(False)", "bools", lambda a: a.logical_or(False),
+     np.array([True, False])),
+    ("a.logical_or(0)", "bools", lambda a: a.logical_or(0),
+     np.array([True, False])),
+    # logical_xor
+    ("a.logical_xor(True)", "bools", lambda a: a.logical_xor(True),
+     np.array([False, True])),
+    ("a.logical_xor(5)", "bools", lambda a: a.logical_xor(5),
+     np.array([False, True])),
+    ("a.logical_xor(False)", "bools", lambda a: a.logical_xor(False),
+     np.array([True, False])),
+    ("a.logical_xor(0)", "bools", lambda a: a.logical_xor(0),
+     np.array([True, False])),
+    # gt, lt, ge, le, eq, ne
+    ("a.gt(0)", "signs", lambda a: a.gt(0), np.array([False, False, True])),
+    ("a.lt(0)", "signs", lambda a: a.lt(0), np.array([True, False, False])),
+    ("a.ge(0)", "signs", lambda a: a.ge(0), np.array([False, True, True])),
+    ("a.le(0)", "signs", lambda a: a.le(0), np.array([True, True, False])),
+    ("a.eq(0)", "signs", lambda a: a.eq(0), np.array([False, True, False])),
+    ("a.ne(0)", "signs", lambda a: a.ne(0), np.array([True, False, True])),
+]
+
+
+@pytest.mark.parametrize("dtype,src,op,expected",
+                         _scalar_op_params(_SCALAR_OP_CASES,
+                                           lambda case: case[3]))
+@pytest.mark.parametrize("device", core_test_utils.list_devices())
+def test_scalar_op(dtype, src, op, expected, device, scalar_op_srcs, bench):
+    a = scalar_op_srcs[str(device), dtype][src]
+    np.testing.assert_array_equal(bench(lambda: op(a)).cpu().numpy(), expected)
+
+
+def _check_inplace_chain(a, ops):
+    """
+    Applies the in-place ops to `a` one after another and checks the value of
+    `a` after each of them. The intermediate values are copied to slots of a
+    device tensor, such that all of them are brought to host at once.
+    """
+    expected = np.stack([step_expected for _, step_expected in ops])
+    steps = o3d.core.Tensor.empty(expected.shape, a.dtype, device=a.device)
+    for i, (op, _) in enumerate(ops):
+        op(a)
+        steps[i] = a
+    np.testing.assert_array_equal(steps.cpu().numpy(), expected)
+
+
+# (description, source, operator, scalar, reflected). The operator is applied
+# the same way to the Open3D tensor and to the Numpy source, which gives the
+# expected value. Reflected cases compute `operator(scalar, a)`.
+_SCALAR_OPERATOR_CASES = [
+    ("a + 1", "ones", operator.add, 1, False),
+    ("1 + a", "ones", operator.add, 1, True),
+    ("a - 1", "ones", operator.sub, 1, False),
+    ("10 - a", "ones", operator.sub, 10, True),
+    ("a * 10", "twos", operator.mul, 10, False),
+    ("10 * a", "twos", operator.mul, 10, True),
+    ("a / 2", "twenties", operator.truediv, 2, False),
+    ("a // 2", "twenties", operator.floordiv, 2, False),
+    ("10 / a", "twenties", operator.truediv, 10, True),
+    ("a > 0", "signs", operator.gt, 0, False),
+    ("a < 0", "signs", operator.lt, 0, False),
+    ("a >= 0", "signs", operator.ge, 0, False),
+    ("a <= 0", "signs", operator.le, 0, False),
+    ("a == 0", "signs", operator.eq, 0, False),
+    ("a != 0", "signs", operator.ne, 0, False),
+]
+
+
+def _scalar_operator_ref(src, op, scalar, reflected):
+    np_src = _SCALAR_OP_NP_SRCS[src]
+    return op(scalar, np_src) if reflected else op(np_src, scalar)
+
+
+@pytest.mark.parametrize("dtype,src,op,scalar,reflected",
+                         _scalar_op_params(
+                             _SCALAR_OPERATOR_CASES,
+                             lambda case: _scalar_operator_ref(*case[1:])))
+@pytest.mark.parametrize("device", core_test_utils.list_devices())
+def test_scalar_operator(dtype, src, op, scalar, reflected, device,
+                         scalar_op_srcs, bench):
+    a = scalar_op_srcs[str(device), dtype][src]
+    if reflected:
+        b = bench(lambda: op(scalar, a))
+    else:
+        b = bench(lambda: op(a, scalar))
+    np.testing.assert_array_equal(
+        b.cpu().numpy(), _scalar_operator_ref(src, op, scalar, reflected))
+
+
+# (description, source, operator) of the operators with a bool scalar on the
+# right, which acts as 1. Each case is run with True and np.True_, such that
+# the Numpy scalar is covered as well.
+_SCALAR_BOOL_OPERATOR_CASES = [
+    ("a + bool", "ones", operator.add),
+    ("a - bool", "ones", operator.sub),
+    ("a * bool", "twos", operator.mul),
+    ("a / bool", "twenties", operator.truediv),
+]
+
+
+@pytest.mark.parametrize("scalar", [True, np.True_], ids=["True", "np.True_"])
+@pytest.mark.parametrize(
+    "dtype,src,op",
+    _scalar_op_params(_SCALAR_BOOL_OPERATOR_CASES,
+                      lambda case: _scalar_operator_ref(*case[1:], 1, False)))
+@pytest.mark.parametrize("device", core_test_utils.list_devices())
+def test_scalar_operator_bool(scalar, dtype, src, op, device, scalar_op_srcs,
+                              bench):
+    a = scalar_op_srcs[str(device), dtype][src]
+    b = bench(lambda: op(a, scalar))
+    np.testing.assert_array_equal(b.cpu().numpy(),
+                                  _scalar_operator_ref(src, op, 1, False))
+
 
+# (description, source, [(in-place op, expected after the op), ...]). The ops
+# of a case are applied one after another to the same tensor.
+_SCALAR_OP_INPLACE_CASES = [
+    # +=
+    ("a.add_(1); a += 1; a += True", "ones", [
+        (lambda a: a.add_(1), _SCALAR_REF[2]),
+        (lambda a: operator.iadd(a, 1), _SCALAR_REF[3]),
+        (lambda a: operator.iadd(a, True), _SCALAR_REF[4]),
+    ]),
+    # -=
+    ("a.sub_(1); a -= 1; a -= True", "ones", [
+        (lambda a: a.sub_(1), _SCALAR_REF[0]),
+        (lambda a: operator.isub(a, 1), _SCALAR_REF[-1]),
+        (lambda a: operator.isub(a, True), _SCALAR_REF[-2]),
+    ]),
+    # *=
+    ("a.mul_(10); a *= 10; a *= True", "twos", [
+        (lambda a: a.mul_(10), _SCALAR_REF[20]),
+        (lambda a: operator.imul(a, 10), _SCALAR_REF[200]),
+        (lambda a: operator.imul(a, True), _SCALAR_REF[200]),
+    ]),
+    # /=
+    ("a.div_(2); a /= 2; a //= 2; a /= True", "twenties", [
+        (lambda a: a.div_(2), _SCALAR_REF[10]),
+        (lambda a: operator.itruediv(a, 2), _SCALAR_REF[5]),
+        (lambda a: operator.ifloordiv(a, 2), _SCALAR_REF[2.5]),
+        (lambda a: operator.itruediv(a, True), _SCALAR_REF[2.5]),
+    ]),
+    # logical_and_
+    ("a.logical_and_(True)", "bools", [
+        (lambda a: a.logical_and_(True), np.array([True, False])),
+    ]),
+    ("a.logical_and_(5)", "bools", [
+        (lambda a: a.logical_and_(5), np.array([True, False])),
+    ]),
+    ("a.logical_and_(False); a.logical_and_(0)", "bools", [
+        (lambda a: a.logical_and_(False), np.array([False, False])),
+        (lambda a: a.logical_and_(0), np.array([False, False])),
+    ]),
     # logical_or_
-    a = o3d.core.Tensor([True, False], device=device)
-    a.logical_or_(True)
-    np.testing.assert_equal(a.cpu().numpy(), np.array([True, True]))
-    a = o3d.core.Tensor([True, False], device=device)
-    a.logical_or_(5)
-    np.testing.assert_equal(a.cpu().numpy(), np.array([True, True]))
-    a = o3d.core.Tensor([True, False], device=device)
-    a.logical_or_(False)
-    np.testing.assert_equal(a.cpu().numpy(), np.array([True, False]))
-    a.logical_or_(0)
-    np.testing.assert_equal(a.cpu().numpy(), np.array([True, False]))
+    ("a.logical_or_(True)", "bools", [
+        (lambda a: a.logical_or_(True), np.array([True, True])),
+    ]),
+    ("a.logical_or_(5)", "bools", [
+        (lambda a: a.logical_or_(5), np.array([True, True])),
+    ]),
+    ("a.logical_or_(False); a.logical_or_(0)", "bools", [
+        (lambda a: a.logical_or_(False), np.array([True, False])),
+        (lambda a: a.logical_or_(0), np.array([True, False])),
+    ]),
+    # logical_xor_
+    ("a.logical_xor_(True)", "bools", [
+        (lambda a: a.logical_xor_(True), np.array([False, True])),
+    ]),
+    ("a.logical_xor_(5)", "bools", [
+        (lambda a: a.logical_xor_(5), np.array([False, True])),
+    ]),
+    ("a.logical_xor_(False); a.logical_xor_(0)", "bools", [
+        (lambda a: a.logical_xor_(False), np.array([True, False])),
+        (lambda a: a.logical_xor_(0), np.array([True, False])),
+    ]),
+    # gt_, lt_, ge_, le_, eq_, ne_
+    ("a.gt_(0)", "signs", [
+        (lambda a: a.gt_(0), np.array([False, False, True])),
+    ]),
+    ("a.lt_(0)", "signs", [
+        (lambda a: a.lt_(0), np.array([True, False, False])),
+    ]),
+    ("a.ge_(0)", "signs", [
+        (lambda a: a.ge_(0), np.array([False, True, True])),
+    ]),
+    ("a.le_(0)", "signs", [
+        (lambda a: a.le_(0), np.array([True, True, False])),
+    ]),
+    ("a.eq_(0)", "signs", [
+        (lambda a: a.eq_(0), np.array([False, True, False])),
+    ]),
+    ("a.ne_(0)", "signs", [
+        (lambda a: a.ne_(0), np.array([True, False, True])),
+    ]),
+]
 
-    # logical_xor
-    a = o3d.core.Tensor([True, False], device=device)
-    np.testing.assert_equal(
-        a.logical_xor(True).cpu().numpy(), np.array([False, True]))
-    np.testing.assert_equal(
-        a.logical_xor(5).cpu().numpy(), np.array([False, True]))
-    np.testing.assert_equal(
-        a.logical_xor(False).cpu().numpy(), np.array([True, False]))
-    np.testing.assert_equal(
-        a.logical_xor(0).cpu().numpy(), np.array([True, False]))
 
-    # logical_xor_
-    a = o3d.core.Tensor([True, False], device=device)
-    a.logical_xor_(True)
-    np.testing.assert_equal(a.cpu().numpy(), np.array([False, True]))
-    a = o3d.core.Tensor([True, False], device=device)
-    a.logical_xor_(5)
-    np.testing.assert_equal(a.cpu().numpy(), np.array([False, True]))
-    a = o3d.core.Tensor([True, False], device=device)
-    a.logical_xor_(False)
-    np.testing.assert_equal(a.cpu().numpy(), np.array([True, False]))
-    a.logical_xor_(0)
-    np.testing.assert_equal(a.cpu().numpy(), np.array([True, False]))
-
-    # gt
-    dtype = o3d.core.Dtype.Float32
-    a = o3d.core.Tensor([-1, 0, 1], dtype=dtype, device=device)
-    np.testing.assert_equal((a.gt(0)).cpu().numpy(),
-                            np.array([False, False, True]))
-    np.testing.assert_equal((a > 0).cpu().numpy(),
-                            np.array([False, False, True]))
-
-    # gt_
-    a = o3d.core.Tensor([-1, 0, 1], dtype=dtype, device=device)
-    a.gt_(0)
-    np.testing.assert_equal(a.cpu().numpy(), np.array([False, False, True]))
-
-    # lt
-    dtype = o3d.core.Dtype.Float32
-    a = o3d.core.Tensor([-1, 0, 1], dtype=dtype, device=device)
-    np.testing.assert_equal((a.lt(0)).cpu().numpy(),
-                            np.array([True, False, False]))
-    np.testing.assert_equal((a < 0).cpu().numpy(),
-                            np.array([True, False, False]))
-
-    # lt_
-    a = o3d.core.Tensor([-1, 0, 1], dtype=dtype, device=device)
-    a.lt_(0)
-    np.testing.assert_equal(a.cpu().numpy(), np.array([True, False, False]))
-
-    # ge
-    dtype = o3d.core.Dtype.Float32
-    a = o3d.core.Tensor([-1, 0, 1], dtype=dtype, device=device)
-    np.testing.assert_equal((a.ge(0)).cpu().numpy(),
-                            np.array([False, True, True]))
-    np.testing.assert_equal((a >= 0).cpu().numpy(),
-                            np.array([False, True, True]))
-
-    # ge_
-    a = o3d.core.Tensor([-1, 0, 1], dtype=dtype, device=device)
-    a.ge_(0)
-    np.testing.assert_equal(a.cpu().numpy(), np.array([False, True, True]))
-
-    # le
-    dtype = o3d.core.Dtype.Float32
-    a = o3d.core.Tensor([-1, 0, 1], dtype=dtype, device=device)
-    np.testing.assert_equal((a.le(0)).cpu().numpy(),
-                            np.array([True, True, False]))
-    np.testing.assert_equal((a <= 0).cpu().numpy(),
-                            np.array([True, True, False]))
-
-    # le_
-    a = o3d.core.Tensor([-1, 0, 1], dtype=dtype, device=device)
-    a.le_(0)
-    np.testing.assert_equal(a.cpu().numpy(), np.array([True, True, False]))
-
-    # eq
-    dtype = o3d.core.Dtype.Float32
-    a = o3d.core.Tensor([-1, 0, 1], dtype=dtype, device=device)
-    np.testing.assert_equal((a.eq(0)).cpu().numpy(),
-                            np.array([False, True, False]))
-    np.testing.assert_equal((a == 0).cpu().numpy(),
-                            np.array([False, True, False]))
-
-    # eq_
-    a = o3d.core.Tensor([-1, 0, 1], dtype=dtype, device=device)
-    a.eq_(0)
-    np.testing.assert_equal(a.cpu().numpy(), np.array([False, True, False]))
-
-    # ne
-    dtype = o3d.core.Dtype.Float32
-    a = o3d.core.Tensor([-1, 0, 1], dtype=dtype, device=device)
-    np.testing.assert_equal((a.ne(0)).cpu().numpy(),
-                            np.array([True, False, True]))
-    np.testing.assert_equal((a != 0).cpu().numpy(),
-                            np.array([True, False, True]))
-
-    # ne_
-    a = o3d.core.Tensor([-1, 0, 1], dtype=dtype, device=device)
-    a.ne_(0)
-    np.testing.assert_equal(a.cpu().numpy(), np.array([True, False, True]))
+@pytest.mark.parametrize(
+    "dtype,src,ops",
+    _scalar_op_params(_SCALAR_OP_INPLACE_CASES,
+                      lambda case: [expected for _, expected in case[2]]))
+@pytest.mark.parametrize("device", core_test_utils.list_devices())
+def test_scalar_op_inplace(dtype, src, ops, device, scalar_op_srcs,
+                           scalar_op_work):
+    a = scalar_op_work[str(device), dtype][src]
+    a[:] = scalar_op_srcs[str(device), dtype][src]
+    _check_inplace_chain(a, ops)
 
 
 @pytest.mark.parametrize("device", core_test_utils.list_devices())
@@ -92,9 +92,13 @@ def test_tensorlist_create(device):
 @pytest.mark.parametrize("device", core_test_utils.list_devices())
 def test_tensorlist_operation(device):
     dtype = o3c.Dtype.Float32
-    t0 = o3c.Tensor.ones((2, 3), dtype, device) * 0
-    t1 = o3c.Tensor.ones((2, 3), dtype, device) * 1
-    t2 = o3c.Tensor.ones((2, 3), dtype, device) * 2
+    # t0, t1, t2 are views of a single tensor, such that the tensorlists of
+    # the test cases are created from slices of it with one copy each.
+    ts = o3c.Tensor(
+        np.arange(3).reshape((3, 1, 1)) * np.ones((3, 2, 3)), dtype, device)
+    t0 = ts[0]
+    t1 = ts[1]
+    t2 = ts[2]
 
     # push_back
     tl = o3c.TensorList(o3c.SizeVector([2, 3]), dtype, device)
@@ -109,11 +113,8 @@ def test_tensorlist_operation(device):
     assert tl.size == 1
 
     # extend
-    tl = o3c.TensorList(o3c.SizeVector([2, 3]), dtype, device)
-    tl.push_back(t0)
-    tl_other = o3c.TensorList(o3c.SizeVector([2, 3]), dtype, device)
-    tl_other.push_back(t1)
-    tl_other.push_back(t2)
+    tl = o3c.TensorList.from_tensor(ts[0:1])
+    tl_other = o3c.TensorList.from_tensor(ts[1:3])
     tl.extend(tl_other)
     assert tl.size == 3
     assert tl[0].allclose(t0)
@@ -121,11 +122,8 @@ def test_tensorlist_operation(device):
     assert tl[2].allclose(t2)
 
     # +=
-    tl = o3c.TensorList(o3c.SizeVector([2, 3]), dtype, device)
-    tl.push_back(t0)
-    tl_other = o3c.TensorList(o3c.SizeVector([2, 3]), dtype, device)
-    tl_other.push_back(t1)
-    tl_other.push_back(t2)
+    tl = o3c.TensorList.from_tensor(ts[0:1])
+    tl_other = o3c.TensorList.from_tensor(ts[1:3])
     tl += tl_other
     assert tl.size == 3
     assert tl[0].allclose(t0)
@@ -133,20 +131,16 @@ def test_tensorlist_operation(device):
     assert tl[2].allclose(t2)
 
     # concat
-    tl = o3c.TensorList(o3c.SizeVector([2, 3]), dtype, device)
-    tl.push_back(t0)
-    tl_other = o3c.TensorList(o3c.SizeVector([2, 3]), dtype, device)
-    tl_other.push_back(t1)
+    tl = o3c.TensorList.from_tensor(ts[0:1])
+    tl_other = o3c.TensorList.from_tensor(ts[1:2])
     tl_combined = o3c.TensorList.concat(tl, tl_other)
     assert tl_combined.size == 2
     assert tl_combined[0].allclose(t0)
     assert tl_combined[1].allclose(t1)
 
     # +
-    tl = o3c.TensorList(o3c.SizeVector([2, 3]), dtype, device)
-    tl.push_back(t0)
-    tl_other = o3c.TensorList(o3c.SizeVector([2, 3]), dtype, device)
-    tl_other.push_back(t1)
+    tl = o3c.TensorList.from_tensor(ts[0:1])
+    tl_other = o3c.TensorList.from_tensor(ts[1:2])
     tl_combined = tl + tl_other
     assert tl_combined.size == 2
     assert tl_combined[0].allclose(t0)